@@ -2,18 +2,23 @@
 Multi-Platform Profile Scraper Service
 Scrapes public profiles from various platforms for talent discovery
 Supports: GitHub, Behance, Stack Overflow, Dev.to
-Uses Playwright with anti-bot measures
+Uses public JSON APIs where available, falling back to Playwright with anti-bot measures
 """
 
 import asyncio
+import html
+import importlib.util
 import json
+import os
 import random
 import sys
 import re
-from typing import List, Dict
+import tempfile
+import time
+from typing import List, Dict, Optional
 
 try:
-    from playwright.async_api import async_playwright, Page
+    from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
 except ImportError:
     print("Error: Playwright not installed. Run: pip install playwright && playwright install chromium", file=sys.stderr)
     sys.exit(1)
@@ -25,6 +30,471 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
 ]
 
+# Link patterns, compiled once at import
+_GH_PROFILE_PATH_RE = re.compile(r'/[a-zA-Z0-9_-]+')
+_SINGLE_SEGMENT_PATH_RE = re.compile(r'/[^/]+')
+_SO_USER_RE = re.compile(r'/users/\d+(?:/|$)')
+_BEHANCE_PROFILE_RE = re.compile(r'https://www\.behance\.net/[a-zA-Z0-9_-]+')
+
+# Requests the extractors never read: heavy assets and third-party trackers
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+BLOCKED_TRACKER_DOMAINS = (
+    'google-analytics', 'googletagmanager', 'doubleclick', 'hotjar', 'segment.com', 'segment.io', 'fullstory'
+)
+
+# In-page resolver for the *_FIELD_MAP tables. Each field spec lists CSS
+# selectors tried in order; single-value fields take the first match whose
+# text length is within [min, max], 'all' fields collect every match of the
+# first selector (capped at 'limit' elements).
+_EXTRACT_BY_MAP_JS = """(fieldMap) => {
+    const text = (el) => el ? (el.innerText || '').trim() : '';
+    const fits = (t, spec) => t.length >= (spec.min || 1) && t.length <= (spec.max || Infinity);
+    const out = {};
+    for (const [field, spec] of Object.entries(fieldMap)) {
+        if (spec.all) {
+            let els = Array.from(document.querySelectorAll(spec.selectors[0]));
+            if (spec.limit) els = els.slice(0, spec.limit);
+            out[field] = els.map(text).filter(t => fits(t, spec));
+            continue;
+        }
+        out[field] = '';
+        for (const sel of spec.selectors) {
+            const t = text(document.querySelector(sel));
+            if (fits(t, spec)) { out[field] = t; break; }
+        }
+    }
+    return out;
+}"""
+
+# Top-level paths on each site that are not user profiles
+GITHUB_SKIP_PATHS = frozenset({
+    'search', 'explore', 'marketplace', 'features', 'pricing',
+    'login', 'signup', 'join', 'settings', 'notifications', 'about'
+})
+BEHANCE_SKIP_PATHS = frozenset({
+    'search', 'galleries', 'joblist', 'adobe', 'features',
+    'assets', 'onboarding', 'hire', 'login', 'signup', 'privacy',
+    'tos', 'help', 'feedback', 'misc', 'about', 'careers', 'gallery'
+})
+DEVTO_SKIP_PATHS = frozenset({
+    'search', 'top', 'latest', 'settings', 'enter', 'signout',
+    'signin', 'notifications', 'reading', 'new', 'tags', 'about',
+    't', 'html', 'css', 'javascript', 'python', 'webdev', 'react'
+})
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ==========================================
+# API SKILLS (cached HTTP path)
+# ==========================================
+# A "skill" is the endpoint set + JSON field mapping that turns a platform's
+# public API into our profile shape. The skills themselves always come from
+# DEFAULT_API_SKILLS; only what is learned at runtime (when a skill last worked,
+# and how long it is rate-limited for) is persisted on disk between runs.
+SKILL_CACHE_PATH = os.environ.get(
+    'SCRAPER_SKILL_CACHE',
+    os.path.join(tempfile.gettempdir(), 'talent_nexus', 'scraper_skills.json')
+)
+
+DEFAULT_API_SKILLS = {
+    'github': {
+        'search': 'https://api.github.com/search/users',
+        'profile': 'https://api.github.com/users/{login}',
+        'repos': 'https://api.github.com/users/{login}/repos',
+        'fields': {
+            'fullName': 'name', 'email': 'email', 'bio': 'bio', 'location': 'location',
+            'profileUrl': 'html_url', 'company': 'company', 'website': 'blog',
+            'followers': 'followers', 'repos': 'public_repos'
+        }
+    },
+    'stackoverflow': {
+        'search': 'https://api.stackexchange.com/2.3/users',
+        'tags': 'https://api.stackexchange.com/2.3/users/{user_id}/top-tags',
+        'fields': {
+            'fullName': 'display_name', 'location': 'location',
+            'profileUrl': 'link', 'website': 'website_url'
+        }
+    },
+    'devto': {
+        'search': 'https://dev.to/api/articles',
+        'profile': 'https://dev.to/api/users/by_username',
+        'fields': {
+            'fullName': 'name', 'bio': 'summary', 'location': 'location',
+            'website': 'website_url'
+        }
+    },
+}
+
+# Parsed API profiles from earlier runs, keyed by profile URL, with the HTTP
+# validators (ETag / Last-Modified) needed to tell if they changed. Entries
+# hold people's names, locations and bios, so nothing is kept across runs
+# unless SCRAPER_PROFILE_CACHE names a file for it
+PROFILE_CACHE_PATH = os.environ.get('SCRAPER_PROFILE_CACHE', '')
+PROFILE_CACHE_MAX_ENTRIES = 5000
+
+_PROFILE_CACHE = None
+
+# Upper bound on profile fetches in flight at once, per scraper call
+MAX_CONCURRENCY = int(os.environ.get('SCRAPER_CONCURRENCY', '5'))
+
+_HTTP_CLIENT = None
+
+# Playwright driver and Chromium instance, launched once and shared by every scraper
+_PLAYWRIGHT = None
+_BROWSER = None
+
+# Browser context arguments, built once per platform per run. The user agent is
+# seeded from the run id so retries within a run present the same fingerprint.
+_VIEWPORT = {'width': 1920, 'height': 1080}
+SCRAPER_RUN_ID = os.environ.get('SCRAPER_RUN_ID', str(os.getpid()))
+_CONTEXT_OPTIONS: Dict[str, Dict] = {}
+
+
+class ApiUnavailable(Exception):
+    """Raised when a platform's API path cannot serve the request."""
+
+
+def _get_http_client():
+    """Return the shared HTTP client, creating it on first use."""
+    global _HTTP_CLIENT
+    if httpx is None:
+        raise ApiUnavailable("httpx not installed")
+    if _HTTP_CLIENT is None:
+        # One pooled transport for every API call, so all profile fetches
+        # share their TCP+TLS sessions (multiplexed when h2 is available)
+        _HTTP_CLIENT = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                http2=importlib.util.find_spec('h2') is not None,
+                limits=httpx.Limits(max_connections=MAX_CONCURRENCY, max_keepalive_connections=MAX_CONCURRENCY)
+            ),
+            headers={'User-Agent': random.choice(USER_AGENTS), 'Accept': 'application/json'},
+            timeout=20.0,
+            follow_redirects=True
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client():
+    """Close the shared HTTP client if it was opened."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+async def _get_browser():
+    """Return the shared Chromium instance, launching it on first use."""
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is None:
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = await async_playwright().start()
+        _BROWSER = await _PLAYWRIGHT.chromium.launch(
+            headless=True, args=['--no-sandbox', '--disable-dev-shm-usage']
+        )
+    return _BROWSER
+
+
+async def close_browser():
+    """Close the shared Chromium instance and stop the Playwright driver."""
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is not None:
+        await _BROWSER.close()
+        _BROWSER = None
+    if _PLAYWRIGHT is not None:
+        await _PLAYWRIGHT.stop()
+        _PLAYWRIGHT = None
+
+
+def _context_options(platform: str) -> Dict:
+    """Return the new_context() arguments for a platform, stable for this run."""
+    options = _CONTEXT_OPTIONS.get(platform)
+    if options is None:
+        rng = random.Random(f"{platform}:{SCRAPER_RUN_ID}")
+        options = {'user_agent': rng.choice(USER_AGENTS), 'viewport': _VIEWPORT}
+        _CONTEXT_OPTIONS[platform] = options
+    return options
+
+
+def _read_json_file(path: str) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_file(path: str, data: Dict):
+    """Atomically replace path with data serialized as JSON."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[Scraper] Could not write {path}: {e}", file=sys.stderr)
+
+
+def _read_skill_cache() -> Dict:
+    return _read_json_file(SKILL_CACHE_PATH)
+
+
+def _write_skill_cache(cache: Dict):
+    _write_json_file(SKILL_CACHE_PATH, cache)
+
+
+def _load_skill(platform: str) -> Dict:
+    """Return a platform's skill unless it is parked by a rate limit."""
+    state = _read_skill_cache().get(platform) or {}
+    blocked_until = state.get('blockedUntil', 0)
+    if blocked_until > time.time():
+        raise ApiUnavailable(f"rate limited for another {int(blocked_until - time.time())}s")
+    return DEFAULT_API_SKILLS[platform]
+
+
+def _mark_skill_verified(platform: str):
+    """Record that a platform's skill just worked, clearing an expired rate-limit park."""
+    cache = _read_skill_cache()
+    state = cache.setdefault(platform, {})
+    state['verifiedAt'] = time.time()
+    # Another fetch in this run may have been parked; that park must outlive the run
+    if state.get('blockedUntil', 0) <= state['verifiedAt']:
+        state.pop('blockedUntil', None)
+    _write_skill_cache(cache)
+
+
+def _block_skill(platform: str, response):
+    """Park a platform's skill until its rate limit window resets."""
+    retry_after = response.headers.get('Retry-After')
+    reset_at = response.headers.get('X-RateLimit-Reset')
+    if retry_after and retry_after.isdigit():
+        until = time.time() + int(retry_after)
+    elif reset_at and reset_at.isdigit():
+        until = float(reset_at)
+    else:
+        until = time.time() + 60
+    cache = _read_skill_cache()
+    cache.setdefault(platform, {})['blockedUntil'] = until
+    _write_skill_cache(cache)
+
+
+def _forget_skill(platform: str):
+    cache = _read_skill_cache()
+    if cache.pop(platform, None) is not None:
+        _write_skill_cache(cache)
+
+
+def _profile_cache() -> Dict:
+    """Return the profile cache, loading it from disk on first use."""
+    global _PROFILE_CACHE
+    if _PROFILE_CACHE is None:
+        _PROFILE_CACHE = _read_json_file(PROFILE_CACHE_PATH) if PROFILE_CACHE_PATH else {}
+    return _PROFILE_CACHE
+
+
+def _cached_profile(profile_url: str) -> Optional[Dict]:
+    entry = _profile_cache().get(profile_url)
+    return dict(entry['profile']) if entry else None
+
+
+def _store_profile(profile_url: str, profile: Dict, response=None):
+    """Remember a parsed profile along with whatever can validate it next run."""
+    entry = {'profile': profile, 'cachedAt': time.time()}
+    if response is not None:
+        entry['etag'] = response.headers.get('ETag', '')
+        entry['lastModified'] = response.headers.get('Last-Modified', '')
+    _profile_cache()[profile_url] = entry
+
+
+def save_profile_cache():
+    """Persist the profile cache, keeping only the most recently cached entries."""
+    if _PROFILE_CACHE is None or not PROFILE_CACHE_PATH:
+        return
+    entries = sorted(_PROFILE_CACHE.items(), key=lambda item: item[1].get('cachedAt', 0), reverse=True)
+    _write_json_file(PROFILE_CACHE_PATH, dict(entries[:PROFILE_CACHE_MAX_ENTRIES]))
+
+
+async def _api_get_if_changed(platform: str, url: str, profile_url: str, headers: Optional[Dict] = None, **kwargs):
+    """Conditional GET against the validators cached for profile_url.
+
+    Returns (None, response) when the server answers 304 Not Modified,
+    otherwise (payload, response).
+    """
+    entry = _profile_cache().get(profile_url) or {}
+    headers = dict(headers or {})
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('lastModified'):
+        headers['If-Modified-Since'] = entry['lastModified']
+    response = await _api_request(platform, url, headers=headers, **kwargs)
+    if response.status_code == 304 and entry:
+        # A revalidated entry counts as fresh for eviction, and a 304 may carry new validators
+        entry['cachedAt'] = time.time()
+        if response.headers.get('ETag'):
+            entry['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            entry['lastModified'] = response.headers['Last-Modified']
+        return None, response
+    return _parse_json(platform, response), response
+
+
+async def _api_request(platform: str, url: str, **kwargs):
+    """GET an API endpoint, translating blocking responses into ApiUnavailable."""
+    client = _get_http_client()
+    try:
+        response = await client.get(url, **kwargs)
+    except httpx.HTTPError as e:
+        raise ApiUnavailable(str(e))
+    if response.status_code in (403, 429):
+        _block_skill(platform, response)
+        raise ApiUnavailable(f"HTTP {response.status_code}")
+    if response.status_code >= 400:
+        raise ApiUnavailable(f"HTTP {response.status_code}")
+    return response
+
+
+def _parse_json(platform: str, response):
+    try:
+        return response.json()
+    except ValueError:
+        _forget_skill(platform)
+        raise ApiUnavailable("response was not JSON")
+
+
+async def _api_get(platform: str, url: str, **kwargs):
+    """GET a JSON endpoint, translating blocking responses into ApiUnavailable."""
+    return _parse_json(platform, await _api_request(platform, url, **kwargs))
+
+
+async def _block_heavy_resources(route):
+    """Route handler that aborts asset and tracker requests and lets the rest through."""
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES or
+            any(domain in request.url for domain in BLOCKED_TRACKER_DOMAINS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _page_hrefs(page: Page, selector: str) -> List[str]:
+    """Return the raw href of every element matching selector in one round-trip."""
+    hrefs = await page.evaluate(
+        "(sel) => Array.from(document.querySelectorAll(sel), a => a.getAttribute('href'))",
+        selector
+    )
+    return [href for href in hrefs if href]
+
+
+async def _wait_for(page: Page, selector: str, timeout: int = 10000) -> bool:
+    """Wait until selector is in the DOM; returns False on timeout instead of raising."""
+    try:
+        await page.wait_for_selector(selector, state='attached', timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def _scroll_for_more(page: Page, selector: str, rounds: int = 3, timeout: int = 5000):
+    """Scroll to the bottom until no new selector matches load, up to rounds times."""
+    for _ in range(rounds):
+        count = await page.evaluate("(sel) => document.querySelectorAll(sel).length", selector)
+        await page.keyboard.press('End')
+        try:
+            await page.wait_for_function(
+                "([sel, count]) => document.querySelectorAll(sel).length > count",
+                arg=[selector, count], timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            break
+
+
+async def _collect_profiles(items: List, fetch_one, max_profiles: int) -> List[Dict]:
+    """Run fetch_one over items with bounded concurrency until max_profiles succeed.
+
+    fetch_one returns a profile dict, or None if the item should be skipped.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    profiles = []
+
+    async def worker(item):
+        async with semaphore:
+            if len(profiles) >= max_profiles:
+                return
+            profile = await fetch_one(item)
+            if profile and len(profiles) < max_profiles:
+                profiles.append(profile)
+
+    await asyncio.gather(*[worker(item) for item in items])
+    return profiles
+
+
+
+async def _scrape_profile_pages(context, profile_urls: List[str], max_profiles: int, extractor,
+                                tag: str, source: str, wait_selector: Optional[str] = None,
+                                delay=(1.5, 2.5), timeout: int = 20000) -> List[Dict]:
+    """Open each profile URL in context and run extractor on it, with bounded concurrency.
+
+    A worker hands its page back to the next one instead of closing it, so no
+    more than MAX_CONCURRENCY pages are open at once. Profiles without a name
+    are skipped.
+    """
+    idle_pages: List[Page] = []
+
+    async def fetch_one(profile_url: str) -> Optional[Dict]:
+        await asyncio.sleep(random.uniform(*delay))
+        print(f"[{tag}] Scraping: {profile_url}", file=sys.stderr)
+        page = idle_pages.pop() if idle_pages else await context.new_page()
+        try:
+            await page.goto(profile_url, wait_until='domcontentloaded', timeout=timeout)
+            if wait_selector:
+                await _wait_for(page, wait_selector)
+            profile = await extractor(page, profile_url)
+        except Exception as e:
+            print(f"[{tag}] Error on {profile_url}: {e}", file=sys.stderr)
+            return None
+        finally:
+            idle_pages.append(page)
+        if not profile.get('fullName'):
+            return None
+        profile['source'] = source
+        print(f"[{tag}] ✓ Scraped: {profile['fullName']}", file=sys.stderr)
+        return profile
+
+    return await _collect_profiles(profile_urls, fetch_one, max_profiles)
+
+def _blank_profile(profile_url: str = '') -> Dict:
+    return {
+        'fullName': '', 'email': '', 'bio': '', 'location': '',
+        'profileUrl': profile_url, 'skills': [], 'company': '',
+        'website': '', 'followers': 0, 'repos': 0
+    }
+
+
+async def _extract_by_map(page: Page, field_map: Dict) -> Dict:
+    """Resolve every field in field_map with a single in-page evaluate call."""
+    return await page.evaluate(_EXTRACT_BY_MAP_JS, field_map)
+
+
+def _map_fields(data: Dict, fields: Dict, profile_url: str = '') -> Dict:
+    """Build a profile dict from an API payload using a skill's field mapping."""
+    profile = _blank_profile(profile_url)
+    for key, source_key in fields.items():
+        value = data.get(source_key)
+        if value:
+            profile[key] = html.unescape(value).strip() if isinstance(value, str) else value
+    profile['bio'] = profile['bio'][:500]
+    return profile
+
 
 async def scrape_profiles(
     platform: str = "github",
@@ -56,167 +526,174 @@ async def scrape_profiles(
 async def scrape_github_profiles(
     query: str, location: str, max_profiles: int, existing_urls: List[str]
 ) -> List[Dict]:
-    """Scrape GitHub user profiles."""
-    profiles = []
-    browser = None
-    
+    """Scrape GitHub user profiles, preferring the REST API over the browser."""
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
-            context = await browser.new_context(
-                user_agent=random.choice(USER_AGENTS),
-                viewport={'width': 1920, 'height': 1080}
+        return await _scrape_github_via_api(query, location, max_profiles, existing_urls)
+    except ApiUnavailable as e:
+        print(f"[GitHub] API unavailable ({e}), falling back to browser", file=sys.stderr)
+    return await _scrape_github_via_browser(query, location, max_profiles, existing_urls)
+
+
+def _github_headers() -> Dict:
+    headers = {'Accept': 'application/vnd.github+json'}
+    token = os.environ.get('GITHUB_TOKEN')
+    if token:
+        headers['Authorization'] = f"Bearer {token}"
+    return headers
+
+
+async def _scrape_github_via_api(
+    query: str, location: str, max_profiles: int, existing_urls: List[str]
+) -> List[Dict]:
+    """Fetch GitHub profiles through the search and users REST endpoints."""
+    skill = _load_skill('github')
+    headers = _github_headers()
+
+    print(f"[GitHub] API search: location:{location} {query}", file=sys.stderr)
+    results = await _api_get('github', skill['search'], headers=headers, params={
+        'q': f"location:{location} {query} type:user",
+        'per_page': min(max_profiles * 2, 100)
+    })
+
+    logins = []
+    seen = set(existing_urls)
+    for item in results.get('items', []):
+        login = item.get('login')
+        if login and f"https://github.com/{login}" not in seen:
+            seen.add(f"https://github.com/{login}")
+            logins.append(login)
+    logins = logins[:max_profiles]
+    print(f"[GitHub] Found {len(logins)} profiles via API", file=sys.stderr)
+
+    async def fetch_one(login: str) -> Optional[Dict]:
+        profile_url = f"https://github.com/{login}"
+        try:
+            user, response = await _api_get_if_changed(
+                'github', skill['profile'].format(login=login), profile_url, headers=headers
             )
-            page = await context.new_page()
-            
-            search_url = f"https://github.com/search?q=type%3Auser+location%3A{location}+{query}&type=users"
-            print(f"[GitHub] Searching: {search_url}", file=sys.stderr)
-            
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
-            await asyncio.sleep(3)
-            
-            # Collect profile URLs from search results
-            profile_urls = []
-            
-            # Try multiple selectors for GitHub's search results
-            selectors = [
-                'a[data-hovercard-type="user"]',
-                'div[data-testid="results-list"] a',
-                '.user-list-item a',
-                'a.Link--primary'
-            ]
-            
-            for selector in selectors:
-                try:
-                    links = await page.query_selector_all(selector)
-                    for link in links:
-                        href = await link.get_attribute('href')
-                        if href and href.startswith('/') and href.count('/') == 1:
-                            full_url = f"https://github.com{href}"
-                            if full_url not in profile_urls and full_url not in existing_urls:
-                                profile_urls.append(full_url)
-                except:
-                    continue
-            
-            # Fallback: extract from page content
-            if len(profile_urls) < 3:
-                content = await page.content()
-                matches = re.findall(r'href="(/[a-zA-Z0-9_-]+)"', content)
-                skip_paths = ['search', 'explore', 'marketplace', 'features', 'pricing', 
-                             'login', 'signup', 'join', 'settings', 'notifications', 'about']
-                for match in matches:
-                    if match.count('/') == 1:
-                        path = match[1:]
-                        if path and len(path) > 1 and path.lower() not in skip_paths:
-                            full_url = f"https://github.com{match}"
-                            if full_url not in profile_urls and full_url not in existing_urls:
-                                profile_urls.append(full_url)
-            
-            print(f"[GitHub] Found {len(profile_urls)} profile URLs", file=sys.stderr)
-            
-            # Scrape each profile
-            for i, profile_url in enumerate(profile_urls[:max_profiles]):
-                try:
-                    await asyncio.sleep(random.uniform(1.5, 2.5))
-                    print(f"[GitHub] Scraping {i+1}/{min(len(profile_urls), max_profiles)}: {profile_url}", file=sys.stderr)
-                    
-                    await page.goto(profile_url, wait_until='domcontentloaded', timeout=20000)
-                    await asyncio.sleep(1)
-                    
-                    profile = await extract_github_profile(page, profile_url)
-                    if profile.get('fullName'):
-                        profile['source'] = 'GitHub'
-                        profiles.append(profile)
-                        print(f"[GitHub] ✓ Scraped: {profile['fullName']}", file=sys.stderr)
-                        
-                except Exception as e:
-                    print(f"[GitHub] Error on {profile_url}: {e}", file=sys.stderr)
-                    continue
-            
-            await browser.close()
-            
-    except Exception as e:
-        print(f"[GitHub] Scraper error: {e}", file=sys.stderr)
-        if browser:
-            await browser.close()
-    
+            if user is None:
+                print(f"[GitHub] ✓ Unchanged: {login}", file=sys.stderr)
+                return _cached_profile(profile_url)
+            repos = await _api_get('github', skill['repos'].format(login=login), headers=headers,
+                                   params={'sort': 'pushed', 'per_page': 10})
+        except ApiUnavailable as e:
+            print(f"[GitHub] Error on {login}: {e}", file=sys.stderr)
+            return None
+        profile = _map_fields(user, skill['fields'], profile_url)
+        if not profile['fullName']:
+            profile['fullName'] = login
+        profile['skills'] = list(dict.fromkeys(repo['language'] for repo in repos if repo.get('language')))
+        profile['source'] = 'GitHub'
+        _store_profile(profile_url, profile, response)
+        print(f"[GitHub] ✓ Fetched: {profile['fullName']}", file=sys.stderr)
+        return profile
+
+    profiles = await _collect_profiles(logins, fetch_one, max_profiles)
+    if logins and not profiles:
+        raise ApiUnavailable("all profile fetches failed")
+    _mark_skill_verified('github')
     return profiles
 
 
-async def extract_github_profile(page: Page, profile_url: str) -> Dict:
-    """Extract data from GitHub profile page."""
-    profile = {
-        'fullName': '', 'email': '', 'bio': '', 'location': '',
-        'profileUrl': profile_url, 'skills': [], 'company': '',
-        'website': '', 'followers': 0, 'repos': 0
-    }
+async def _scrape_github_via_browser(
+    query: str, location: str, max_profiles: int, existing_urls: List[str]
+) -> List[Dict]:
+    """Scrape GitHub user profiles by rendering pages in Chromium."""
+    profiles = []
+    context = None
+    list_context = None
     
     try:
-        # Name - try multiple selectors
-        for sel in ['span.p-name', '[itemprop="name"]', 'h1.vcard-names span']:
-            try:
-                name_el = await page.query_selector(sel)
-                if name_el:
-                    text = (await name_el.inner_text()).strip()
-                    if text and len(text) > 1:
-                        profile['fullName'] = text
-                        break
-            except:
-                continue
+        browser = await _get_browser()
+        # The list page is server-rendered, so it is loaded with JavaScript disabled
+        list_context = await browser.new_context(**_context_options('github'), java_script_enabled=False)
+        await list_context.route("**/*", _block_heavy_resources)
+        page = await list_context.new_page()
         
-        # Fallback to username
-        if not profile['fullName']:
-            try:
-                username_el = await page.query_selector('span.p-nickname, .vcard-username')
-                if username_el:
-                    profile['fullName'] = (await username_el.inner_text()).strip()
-            except:
-                pass
+        search_url = f"https://github.com/search?q=type%3Auser+location%3A{location}+{query}&type=users"
+        print(f"[GitHub] Searching: {search_url}", file=sys.stderr)
         
-        # Bio
-        for sel in ['div.p-note', '.user-profile-bio', '[data-bio-text]']:
-            try:
-                bio_el = await page.query_selector(sel)
-                if bio_el:
-                    text = (await bio_el.inner_text()).strip()
-                    if text:
-                        profile['bio'] = text[:500]
-                        break
-            except:
-                continue
+        # Try multiple selectors for GitHub's search results
+        selectors = [
+            'a[data-hovercard-type="user"]',
+            'div[data-testid="results-list"] a',
+            '.user-list-item a',
+            'a.Link--primary'
+        ]
+        
+        await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
+        await _wait_for(page, ', '.join(selectors))
+        
+        # Collect profile URLs from search results
+        profile_urls: List[str] = []
+        seen = set(existing_urls)
         
-        # Location
-        for sel in ['[itemprop="homeLocation"]', '.p-label', 'li[itemprop="homeLocation"] span']:
+        for selector in selectors:
             try:
-                loc_el = await page.query_selector(sel)
-                if loc_el:
-                    text = (await loc_el.inner_text()).strip()
-                    if text:
-                        profile['location'] = text
-                        break
+                hrefs = await _page_hrefs(page, selector)
             except:
                 continue
+            for href in hrefs:
+                if _SINGLE_SEGMENT_PATH_RE.fullmatch(href):
+                    full_url = f"https://github.com{href}"
+                    if full_url not in seen:
+                        seen.add(full_url)
+                        profile_urls.append(full_url)
         
-        # Company
-        try:
-            company_el = await page.query_selector('[itemprop="worksFor"] span, .p-org')
-            if company_el:
-                profile['company'] = (await company_el.inner_text()).strip()
-        except:
-            pass
+        # Fallback: any single-segment site link in the rendered page
+        if len(profile_urls) < 3:
+            hrefs = await _page_hrefs(page, 'a[href^="/"]')
+            for match in hrefs:
+                if _GH_PROFILE_PATH_RE.fullmatch(match):
+                    path = match[1:]
+                    if len(path) > 1 and path.lower() not in GITHUB_SKIP_PATHS:
+                        full_url = f"https://github.com{match}"
+                        if full_url not in seen:
+                            seen.add(full_url)
+                            profile_urls.append(full_url)
         
-        # Skills from pinned repos language badges
-        try:
-            lang_els = await page.query_selector_all('[itemprop="programmingLanguage"], .repo-language-color + span')
-            seen = set()
-            for el in lang_els:
-                skill = (await el.inner_text()).strip()
-                if skill and skill not in seen:
-                    profile['skills'].append(skill)
-                    seen.add(skill)
-        except:
-            pass
-                
+        await list_context.close()
+        list_context = None
+        
+        context = await browser.new_context(**_context_options('github'))
+        await context.route("**/*", _block_heavy_resources)
+        
+        print(f"[GitHub] Found {len(profile_urls)} profile URLs", file=sys.stderr)
+        
+        profiles = await _scrape_profile_pages(
+            context, profile_urls[:max_profiles], max_profiles, extract_github_profile,
+            tag='GitHub', source='GitHub'
+        )
+        
+    except Exception as e:
+        print(f"[GitHub] Scraper error: {e}", file=sys.stderr)
+    finally:
+        if list_context:
+            await list_context.close()
+        if context:
+            await context.close()
+    
+    return profiles
+
+
+GITHUB_FIELD_MAP = {
+    'fullName': {'selectors': ['span.p-name', '[itemprop="name"]', 'h1.vcard-names span',
+                               'span.p-nickname, .vcard-username'], 'min': 2},
+    'bio': {'selectors': ['div.p-note', '.user-profile-bio', '[data-bio-text]']},
+    'location': {'selectors': ['[itemprop="homeLocation"]', '.p-label', 'li[itemprop="homeLocation"] span']},
+    'company': {'selectors': ['[itemprop="worksFor"] span, .p-org']},
+    'skills': {'selectors': ['[itemprop="programmingLanguage"], .repo-language-color + span'], 'all': True},
+}
+
+
+async def extract_github_profile(page: Page, profile_url: str) -> Dict:
+    """Extract data from GitHub profile page."""
+    profile = _blank_profile(profile_url)
+    
+    try:
+        profile.update(await _extract_by_map(page, GITHUB_FIELD_MAP))
+        profile['bio'] = profile['bio'][:500]
+        profile['skills'] = list(dict.fromkeys(profile['skills']))
     except Exception as e:
         print(f"[GitHub] Extract error: {e}", file=sys.stderr)
     
@@ -231,130 +708,72 @@ async def scrape_behance_profiles(
 ) -> List[Dict]:
     """Scrape Behance user profiles."""
     profiles = []
-    browser = None
+    context = None
     
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
-            context = await browser.new_context(
-                user_agent=random.choice(USER_AGENTS),
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = await context.new_page()
-            
-            search_url = f"https://www.behance.net/search/users?search={query}%20{location}"
-            print(f"[Behance] Searching: {search_url}", file=sys.stderr)
-            
-            await page.goto(search_url, wait_until='networkidle', timeout=45000)
-            await asyncio.sleep(4)
-            
-            # Scroll to load more
-            for _ in range(3):
-                await page.keyboard.press('End')
-                await asyncio.sleep(1.5)
-            
-            # Extract profile URLs
-            profile_urls = []
-            content = await page.content()
-            
-            # Find user profile links
-            matches = re.findall(r'href="(https://www\.behance\.net/[a-zA-Z0-9_-]+)"', content)
-            skip_paths = ['search', 'galleries', 'joblist', 'adobe', 'features', 
-                         'assets', 'onboarding', 'hire', 'login', 'signup', 'privacy',
-                         'tos', 'help', 'feedback', 'misc', 'about', 'careers', 'gallery']
-            
-            for match in matches:
-                path = match.replace('https://www.behance.net/', '').split('/')[0].split('?')[0]
-                if (path and len(path) > 2 and path.lower() not in skip_paths and
-                    not path.startswith('gallery') and
-                    match not in profile_urls and match not in existing_urls):
-                    profile_urls.append(match)
-            
-            print(f"[Behance] Found {len(profile_urls)} profile URLs", file=sys.stderr)
-            
-            # Scrape profiles
-            scraped = 0
-            for profile_url in profile_urls:
-                if scraped >= max_profiles:
-                    break
-                try:
-                    await asyncio.sleep(random.uniform(2, 3))
-                    await page.goto(profile_url, wait_until='domcontentloaded', timeout=25000)
-                    await asyncio.sleep(2)
-                    
-                    profile = await extract_behance_profile(page, profile_url)
-                    if profile.get('fullName'):
-                        profile['source'] = 'Behance'
-                        profiles.append(profile)
-                        scraped += 1
-                        print(f"[Behance] ✓ Scraped: {profile['fullName']}", file=sys.stderr)
-                except Exception as e:
-                    print(f"[Behance] Error: {e}", file=sys.stderr)
-                    continue
-            
-            await browser.close()
-            
+        browser = await _get_browser()
+        context = await browser.new_context(**_context_options('behance'))
+        await context.route("**/*", _block_heavy_resources)
+        page = await context.new_page()
+        
+        search_url = f"https://www.behance.net/search/users?search={query}%20{location}"
+        print(f"[Behance] Searching: {search_url}", file=sys.stderr)
+        
+        profile_link_selector = 'a[href^="https://www.behance.net/"]'
+        await page.goto(search_url, wait_until='domcontentloaded', timeout=45000)
+        await _wait_for(page, profile_link_selector)
+        
+        # Scroll to load more
+        await _scroll_for_more(page, profile_link_selector)
+        
+        # Extract profile URLs
+        profile_urls: List[str] = []
+        seen = set(existing_urls)
+        
+        # Find user profile links
+        hrefs = await _page_hrefs(page, profile_link_selector)
+        matches = [href for href in hrefs if _BEHANCE_PROFILE_RE.fullmatch(href)]
+        
+        for match in matches:
+            path = match.replace('https://www.behance.net/', '').split('/')[0].split('?')[0]
+            if (path and len(path) > 2 and path.lower() not in BEHANCE_SKIP_PATHS and
+                not path.startswith('gallery') and
+                match not in seen):
+                seen.add(match)
+                profile_urls.append(match)
+        
+        print(f"[Behance] Found {len(profile_urls)} profile URLs", file=sys.stderr)
+        
+        profiles = await _scrape_profile_pages(
+            context, profile_urls, max_profiles, extract_behance_profile,
+            tag='Behance', source='Behance',
+            wait_selector='h1, [class*="userName"]', delay=(2, 3), timeout=25000
+        )
+        
     except Exception as e:
         print(f"[Behance] Scraper error: {e}", file=sys.stderr)
-        if browser:
-            await browser.close()
+    finally:
+        if context:
+            await context.close()
     
     return profiles
 
 
+BEHANCE_FIELD_MAP = {
+    'fullName': {'selectors': ['h1', '.e2e-Profile-userName', '[class*="userName"]', '.UserInfo-userName'],
+                 'min': 2, 'max': 99},
+    'bio': {'selectors': ['[class*="bio"]', '[class*="headline"]', '.UserInfo-bio'], 'min': 11, 'max': 499},
+    'location': {'selectors': ['[class*="location"]', '[class*="Location"]', '.UserInfo-location']},
+    'skills': {'selectors': ['[class*="field"], [class*="skill"]'], 'all': True, 'limit': 10, 'max': 49},
+}
+
+
 async def extract_behance_profile(page: Page, profile_url: str) -> Dict:
     """Extract data from Behance profile."""
-    profile = {
-        'fullName': '', 'email': '', 'bio': '', 'location': '',
-        'profileUrl': profile_url, 'skills': [], 'company': '',
-        'website': '', 'followers': 0, 'repos': 0
-    }
+    profile = _blank_profile(profile_url)
     
     try:
-        # Name
-        for sel in ['h1', '.e2e-Profile-userName', '[class*="userName"]', '.UserInfo-userName']:
-            try:
-                name_el = await page.query_selector(sel)
-                if name_el:
-                    text = (await name_el.inner_text()).strip()
-                    if text and len(text) > 1 and len(text) < 100:
-                        profile['fullName'] = text
-                        break
-            except:
-                continue
-        
-        # Bio
-        for sel in ['[class*="bio"]', '[class*="headline"]', '.UserInfo-bio']:
-            try:
-                bio_el = await page.query_selector(sel)
-                if bio_el:
-                    text = (await bio_el.inner_text()).strip()
-                    if text and len(text) > 10 and len(text) < 500:
-                        profile['bio'] = text
-                        break
-            except:
-                continue
-        
-        # Location
-        for sel in ['[class*="location"]', '[class*="Location"]', '.UserInfo-location']:
-            try:
-                loc_el = await page.query_selector(sel)
-                if loc_el:
-                    profile['location'] = (await loc_el.inner_text()).strip()
-                    break
-            except:
-                continue
-        
-        # Skills from fields
-        try:
-            skill_els = await page.query_selector_all('[class*="field"], [class*="skill"]')
-            for el in skill_els[:10]:
-                skill = (await el.inner_text()).strip()
-                if skill and len(skill) < 50:
-                    profile['skills'].append(skill)
-        except:
-            pass
-                
+        profile.update(await _extract_by_map(page, BEHANCE_FIELD_MAP))
     except Exception as e:
         print(f"[Behance] Extract error: {e}", file=sys.stderr)
     
@@ -367,115 +786,123 @@ async def extract_behance_profile(page: Page, profile_url: str) -> Dict:
 async def scrape_stackoverflow_profiles(
     query: str, location: str, max_profiles: int, existing_urls: List[str]
 ) -> List[Dict]:
-    """Scrape Stack Overflow user profiles."""
+    """Scrape Stack Overflow user profiles, preferring the Stack Exchange API."""
+    try:
+        return await _scrape_stackoverflow_via_api(max_profiles, existing_urls)
+    except ApiUnavailable as e:
+        print(f"[StackOverflow] API unavailable ({e}), falling back to browser", file=sys.stderr)
+    return await _scrape_stackoverflow_via_browser(query, location, max_profiles, existing_urls)
+
+
+async def _scrape_stackoverflow_via_api(max_profiles: int, existing_urls: List[str]) -> List[Dict]:
+    """Fetch top Stack Overflow users by reputation through the Stack Exchange API."""
+    skill = _load_skill('stackoverflow')
+
+    results = await _api_get('stackoverflow', skill['search'], params={
+        'order': 'desc', 'sort': 'reputation', 'site': 'stackoverflow',
+        'pagesize': min(max_profiles * 2, 100)
+    })
+
+    seen = set(existing_urls)
+    users = [u for u in results.get('items', []) if u.get('link') and u['link'] not in seen]
+    users = users[:max_profiles]
+    print(f"[StackOverflow] Found {len(users)} profiles via API", file=sys.stderr)
+
+    async def fetch_one(user: Dict) -> Optional[Dict]:
+        try:
+            tags = await _api_get('stackoverflow', skill['tags'].format(user_id=user['user_id']),
+                                  params={'site': 'stackoverflow', 'pagesize': 15})
+        except ApiUnavailable as e:
+            print(f"[StackOverflow] Error on {user.get('link')}: {e}", file=sys.stderr)
+            return None
+        profile = _map_fields(user, skill['fields'])
+        profile['skills'] = [t['tag_name'] for t in tags.get('items', []) if t.get('tag_name')]
+        profile['source'] = 'Stack Overflow'
+        print(f"[StackOverflow] ✓ Fetched: {profile['fullName']}", file=sys.stderr)
+        return profile
+
+    profiles = await _collect_profiles(users, fetch_one, max_profiles)
+    if users and not profiles:
+        raise ApiUnavailable("all profile fetches failed")
+    _mark_skill_verified('stackoverflow')
+    return [p for p in profiles if p.get('fullName')]
+
+
+async def _scrape_stackoverflow_via_browser(
+    query: str, location: str, max_profiles: int, existing_urls: List[str]
+) -> List[Dict]:
+    """Scrape Stack Overflow user profiles by rendering pages in Chromium."""
     profiles = []
-    browser = None
+    context = None
+    list_context = None
     
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
-            context = await browser.new_context(
-                user_agent=random.choice(USER_AGENTS),
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = await context.new_page()
-            
-            # Search users by reputation
-            search_url = f"https://stackoverflow.com/users?tab=reputation&filter=all"
-            print(f"[StackOverflow] Searching: {search_url}", file=sys.stderr)
-            
-            await page.goto(search_url, wait_until='networkidle', timeout=30000)
-            await asyncio.sleep(3)
-            
-            # Get user profile links
-            profile_urls = []
-            links = await page.query_selector_all('a[href*="/users/"]')
-            
-            for link in links:
-                href = await link.get_attribute('href')
-                if href and '/users/' in href:
-                    full_url = href if href.startswith('http') else f"https://stackoverflow.com{href}"
-                    if (re.match(r'.*/users/\d+/.*', full_url) or re.match(r'.*/users/\d+$', full_url)):
-                        if full_url not in profile_urls and full_url not in existing_urls:
-                            profile_urls.append(full_url)
-            
-            print(f"[StackOverflow] Found {len(profile_urls)} profiles", file=sys.stderr)
-            
-            # Scrape profiles
-            for i, profile_url in enumerate(profile_urls[:max_profiles]):
-                try:
-                    await asyncio.sleep(random.uniform(1.5, 2.5))
-                    await page.goto(profile_url, wait_until='domcontentloaded', timeout=20000)
-                    await asyncio.sleep(1)
-                    
-                    profile = await extract_stackoverflow_profile(page, profile_url)
-                    if profile.get('fullName'):
-                        profile['source'] = 'Stack Overflow'
-                        profiles.append(profile)
-                        print(f"[StackOverflow] ✓ Scraped: {profile['fullName']}", file=sys.stderr)
-                except Exception as e:
-                    print(f"[StackOverflow] Error: {e}", file=sys.stderr)
-                    continue
-            
-            await browser.close()
-            
+        browser = await _get_browser()
+        # The list page is server-rendered, so it is loaded with JavaScript disabled
+        list_context = await browser.new_context(**_context_options('stackoverflow'), java_script_enabled=False)
+        await list_context.route("**/*", _block_heavy_resources)
+        page = await list_context.new_page()
+        
+        # Search users by reputation
+        search_url = f"https://stackoverflow.com/users?tab=reputation&filter=all"
+        print(f"[StackOverflow] Searching: {search_url}", file=sys.stderr)
+        
+        await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
+        await _wait_for(page, 'a[href*="/users/"]')
+        
+        # Get user profile links
+        profile_urls: List[str] = []
+        seen = set(existing_urls)
+        hrefs = await _page_hrefs(page, 'a[href*="/users/"]')
+        
+        for href in hrefs:
+            # Match on the raw href; only build URLs for actual user profile links
+            if _SO_USER_RE.search(href):
+                full_url = href if href.startswith('http') else f"https://stackoverflow.com{href}"
+                if full_url not in seen:
+                    seen.add(full_url)
+                    profile_urls.append(full_url)
+        
+        await list_context.close()
+        list_context = None
+        
+        context = await browser.new_context(**_context_options('stackoverflow'))
+        await context.route("**/*", _block_heavy_resources)
+        
+        print(f"[StackOverflow] Found {len(profile_urls)} profiles", file=sys.stderr)
+        
+        profiles = await _scrape_profile_pages(
+            context, profile_urls[:max_profiles], max_profiles, extract_stackoverflow_profile,
+            tag='StackOverflow', source='Stack Overflow'
+        )
+        
     except Exception as e:
         print(f"[StackOverflow] Error: {e}", file=sys.stderr)
-        if browser:
-            await browser.close()
+    finally:
+        if list_context:
+            await list_context.close()
+        if context:
+            await context.close()
     
     return profiles
 
 
+STACKOVERFLOW_FIELD_MAP = {
+    'fullName': {'selectors': ['h1', '.fs-headline2', '[itemprop="name"]', '.user-card-name'], 'max': 99},
+    'bio': {'selectors': ['.js-about-me-content, .user-about-me']},
+    'location': {'selectors': ['[itemprop="homeLocation"], .user-card-location']},
+    'skills': {'selectors': ['.s-tag, .post-tag, .tag'], 'all': True, 'limit': 15},
+}
+
+
 async def extract_stackoverflow_profile(page: Page, profile_url: str) -> Dict:
     """Extract data from Stack Overflow profile."""
-    profile = {
-        'fullName': '', 'email': '', 'bio': '', 'location': '',
-        'profileUrl': profile_url, 'skills': [], 'company': '',
-        'website': '', 'followers': 0, 'repos': 0
-    }
+    profile = _blank_profile(profile_url)
     
     try:
-        # Name
-        for sel in ['h1', '.fs-headline2', '[itemprop="name"]', '.user-card-name']:
-            try:
-                name_el = await page.query_selector(sel)
-                if name_el:
-                    text = (await name_el.inner_text()).strip()
-                    if text and len(text) < 100:
-                        profile['fullName'] = text
-                        break
-            except:
-                continue
-        
-        # Bio
-        try:
-            bio_el = await page.query_selector('.js-about-me-content, .user-about-me')
-            if bio_el:
-                profile['bio'] = (await bio_el.inner_text()).strip()[:500]
-        except:
-            pass
-        
-        # Location
-        try:
-            loc_el = await page.query_selector('[itemprop="homeLocation"], .user-card-location')
-            if loc_el:
-                profile['location'] = (await loc_el.inner_text()).strip()
-        except:
-            pass
-        
-        # Tags/Skills
-        try:
-            tag_els = await page.query_selector_all('.s-tag, .post-tag, .tag')
-            seen = set()
-            for el in tag_els[:15]:
-                tag = (await el.inner_text()).strip()
-                if tag and tag not in seen:
-                    profile['skills'].append(tag)
-                    seen.add(tag)
-        except:
-            pass
-                
+        profile.update(await _extract_by_map(page, STACKOVERFLOW_FIELD_MAP))
+        profile['bio'] = profile['bio'][:500]
+        profile['skills'] = list(dict.fromkeys(profile['skills']))
     except Exception as e:
         print(f"[StackOverflow] Extract error: {e}", file=sys.stderr)
     
@@ -488,124 +915,126 @@ async def extract_stackoverflow_profile(page: Page, profile_url: str) -> Dict:
 async def scrape_devto_profiles(
     query: str, max_profiles: int, existing_urls: List[str]
 ) -> List[Dict]:
-    """Scrape Dev.to developer profiles."""
+    """Scrape Dev.to developer profiles, preferring the Forem API."""
+    try:
+        return await _scrape_devto_via_api(max_profiles, existing_urls)
+    except ApiUnavailable as e:
+        print(f"[Dev.to] API unavailable ({e}), falling back to browser", file=sys.stderr)
+    return await _scrape_devto_via_browser(query, max_profiles, existing_urls)
+
+
+async def _scrape_devto_via_api(max_profiles: int, existing_urls: List[str]) -> List[Dict]:
+    """Fetch Dev.to article authors through the public articles and users endpoints."""
+    skill = _load_skill('devto')
+
+    articles = await _api_get('devto', skill['search'], params={'per_page': 60})
+
+    usernames = []
+    seen = set(existing_urls)
+    for article in articles:
+        username = (article.get('user') or {}).get('username')
+        if username and f"https://dev.to/{username}" not in seen:
+            seen.add(f"https://dev.to/{username}")
+            usernames.append(username)
+    usernames = usernames[:max_profiles]
+    print(f"[Dev.to] Found {len(usernames)} profiles via API", file=sys.stderr)
+
+    async def fetch_one(username: str) -> Optional[Dict]:
+        profile_url = f"https://dev.to/{username}"
+        try:
+            user, response = await _api_get_if_changed(
+                'devto', skill['profile'], profile_url, params={'url': username}
+            )
+        except ApiUnavailable as e:
+            print(f"[Dev.to] Error on {username}: {e}", file=sys.stderr)
+            return None
+        if user is None:
+            print(f"[Dev.to] ✓ Unchanged: {username}", file=sys.stderr)
+            return _cached_profile(profile_url)
+        profile = _map_fields(user, skill['fields'], profile_url)
+        profile['source'] = 'Dev.to'
+        _store_profile(profile_url, profile, response)
+        print(f"[Dev.to] ✓ Fetched: {profile['fullName']}", file=sys.stderr)
+        return profile
+
+    profiles = await _collect_profiles(usernames, fetch_one, max_profiles)
+    if usernames and not profiles:
+        raise ApiUnavailable("all profile fetches failed")
+    _mark_skill_verified('devto')
+    return [p for p in profiles if p.get('fullName')]
+
+
+async def _scrape_devto_via_browser(
+    query: str, max_profiles: int, existing_urls: List[str]
+) -> List[Dict]:
+    """Scrape Dev.to developer profiles by rendering pages in Chromium."""
     profiles = []
-    browser = None
+    context = None
     
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=['--no-sandbox'])
-            context = await browser.new_context(
-                user_agent=random.choice(USER_AGENTS),
-                viewport={'width': 1920, 'height': 1080}
-            )
-            page = await context.new_page()
-            
-            await page.goto("https://dev.to/", wait_until='networkidle', timeout=30000)
-            await asyncio.sleep(3)
-            
-            # Scroll for more content
-            for _ in range(3):
-                await page.keyboard.press('End')
-                await asyncio.sleep(1)
-            
-            # Extract author profile URLs from articles
-            profile_urls = []
-            author_links = await page.query_selector_all('a[href^="/"][class*="author"], .crayons-story__secondary a')
-            
-            for link in author_links:
-                try:
-                    href = await link.get_attribute('href')
-                    if href and href.startswith('/') and href.count('/') == 1:
-                        path = href[1:]
-                        skip = ['search', 'top', 'latest', 'settings', 'enter', 'signout', 
-                               'signin', 'notifications', 'reading', 'new', 'tags', 'about',
-                               't', 'html', 'css', 'javascript', 'python', 'webdev', 'react']
-                        if path and len(path) > 2 and path.lower() not in skip:
-                            full_url = f"https://dev.to{href}"
-                            if full_url not in profile_urls and full_url not in existing_urls:
-                                profile_urls.append(full_url)
-                except:
-                    continue
-            
-            print(f"[Dev.to] Found {len(profile_urls)} profiles", file=sys.stderr)
-            
-            # Scrape profiles
-            scraped = 0
-            for profile_url in profile_urls:
-                if scraped >= max_profiles:
-                    break
-                try:
-                    await asyncio.sleep(random.uniform(1.5, 2.5))
-                    await page.goto(profile_url, wait_until='domcontentloaded', timeout=20000)
-                    await asyncio.sleep(1)
-                    
-                    # Check if it's a user profile
-                    profile_check = await page.query_selector('.profile-header, .crayons-card--profile, .profile-details')
-                    if not profile_check:
-                        continue
-                    
-                    profile = await extract_devto_profile(page, profile_url)
-                    if profile.get('fullName'):
-                        profile['source'] = 'Dev.to'
-                        profiles.append(profile)
-                        scraped += 1
-                        print(f"[Dev.to] ✓ Scraped: {profile['fullName']}", file=sys.stderr)
-                except Exception as e:
-                    print(f"[Dev.to] Error: {e}", file=sys.stderr)
-                    continue
-            
-            await browser.close()
-            
+        browser = await _get_browser()
+        context = await browser.new_context(**_context_options('devto'))
+        await context.route("**/*", _block_heavy_resources)
+        page = await context.new_page()
+        
+        author_selector = 'a[href^="/"][class*="author"], .crayons-story__secondary a'
+        await page.goto("https://dev.to/", wait_until='domcontentloaded', timeout=30000)
+        await _wait_for(page, author_selector)
+        
+        # Scroll for more content
+        await _scroll_for_more(page, author_selector)
+        
+        # Extract author profile URLs from articles
+        profile_urls: List[str] = []
+        seen = set(existing_urls)
+        hrefs = await _page_hrefs(page, author_selector)
+        
+        for href in hrefs:
+            if _SINGLE_SEGMENT_PATH_RE.fullmatch(href):
+                path = href[1:]
+                if len(path) > 2 and path.lower() not in DEVTO_SKIP_PATHS:
+                    full_url = f"https://dev.to{href}"
+                    if full_url not in seen:
+                        seen.add(full_url)
+                        profile_urls.append(full_url)
+        
+        print(f"[Dev.to] Found {len(profile_urls)} profiles", file=sys.stderr)
+        
+        # Author links can point at organisations, which have no profile card
+        async def extract_if_user(page: Page, profile_url: str) -> Dict:
+            if not await page.query_selector('.profile-header, .crayons-card--profile, .profile-details'):
+                return _blank_profile(profile_url)
+            return await extract_devto_profile(page, profile_url)
+        
+        profiles = await _scrape_profile_pages(
+            context, profile_urls, max_profiles, extract_if_user,
+            tag='Dev.to', source='Dev.to'
+        )
+        
     except Exception as e:
         print(f"[Dev.to] Error: {e}", file=sys.stderr)
-        if browser:
-            await browser.close()
+    finally:
+        if context:
+            await context.close()
     
     return profiles
 
 
+DEVTO_FIELD_MAP = {
+    'fullName': {'selectors': ['h1', '.profile-header__name', '.crayons-title', '.profile-details h1'],
+                 'min': 2, 'max': 99},
+    'bio': {'selectors': ['.profile-header__bio', '.profile-header__summary', '.profile-details p'], 'min': 6},
+    'location': {'selectors': ['[class*="location"]']},
+}
+
+
 async def extract_devto_profile(page: Page, profile_url: str) -> Dict:
     """Extract data from Dev.to profile."""
-    profile = {
-        'fullName': '', 'email': '', 'bio': '', 'location': '',
-        'profileUrl': profile_url, 'skills': [], 'company': '',
-        'website': '', 'followers': 0, 'repos': 0
-    }
+    profile = _blank_profile(profile_url)
     
     try:
-        # Name
-        for sel in ['h1', '.profile-header__name', '.crayons-title', '.profile-details h1']:
-            try:
-                name_el = await page.query_selector(sel)
-                if name_el:
-                    text = (await name_el.inner_text()).strip()
-                    if text and len(text) > 1 and len(text) < 100:
-                        profile['fullName'] = text
-                        break
-            except:
-                continue
-        
-        # Bio
-        for sel in ['.profile-header__bio', '.profile-header__summary', '.profile-details p']:
-            try:
-                bio_el = await page.query_selector(sel)
-                if bio_el:
-                    text = (await bio_el.inner_text()).strip()
-                    if text and len(text) > 5:
-                        profile['bio'] = text[:500]
-                        break
-            except:
-                continue
-        
-        # Location
-        try:
-            loc_el = await page.query_selector('[class*="location"]')
-            if loc_el:
-                profile['location'] = (await loc_el.inner_text()).strip()
-        except:
-            pass
-                
+        profile.update(await _extract_by_map(page, DEVTO_FIELD_MAP))
+        profile['bio'] = profile['bio'][:500]
     except Exception as e:
         print(f"[Dev.to] Extract error: {e}", file=sys.stderr)
     
@@ -630,16 +1059,32 @@ async def main():
     except:
         existing_urls = []
     
-    profiles = await scrape_profiles(
-        platform=args.platform,
-        query=args.query,
-        location=args.location,
-        max_profiles=args.max,
-        existing_urls=existing_urls
-    )
+    try:
+        profiles = await scrape_profiles(
+            platform=args.platform,
+            query=args.query,
+            location=args.location,
+            max_profiles=args.max,
+            existing_urls=existing_urls
+        )
+    finally:
+        await close_http_client()
+        await close_browser()
+        save_profile_cache()
     
     # Output JSON to stdout (only profiles, logs go to stderr)
-    print(json.dumps(profiles, indent=2))
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(profiles)
+        except orjson.JSONEncodeError:
+            # Scraped text can hold lone surrogates, which orjson rejects
+            payload = None
+    if payload is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload + b"\n")
+    else:
+        print(json.dumps(profiles, separators=(',', ':')))
 
 
 if __name__ == "__main__":
@@ -9,11 +9,33 @@ Returns: Extracted text to stdout, errors to stderr
 
 import sys
 from pypdf import PdfReader
-import io
+from pdf_pages import iter_page_texts
 
 # Configure stdout/stderr for UTF-8
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+
+# Plain-mode "words" longer than this are usually adjacent columns run together
+GLUED_WORD_LENGTH = 30
+GLUED_WORD_RATIO = 0.05
+
+# Documents with fewer pages are extracted in-process
+PARALLEL_PAGE_THRESHOLD = 3
+
+def needs_layout_mode(text):
+    """Check whether plain extraction looks like it collapsed a multi-column page"""
+    words = text.split() if text else []
+    if not words:
+        return True
+    glued = sum(1 for word in words if len(word) > GLUED_WORD_LENGTH)
+    return glued / len(words) > GLUED_WORD_RATIO
+
+def extract_page_text(page):
+    """Extract one page, in plain mode unless it garbles the page"""
+    text = page.extract_text()
+    if needs_layout_mode(text):
+        text = page.extract_text(extraction_mode="layout")
+    return text
 
 def extract_text_from_pdf(pdf_path):
     try:
@@ -26,24 +48,19 @@ def extract_text_from_pdf(pdf_path):
                 print("Error: PDF has no pages", file=sys.stderr)
                 sys.exit(1)
             
-            extracted_text = ""
+            has_text = False
             
-            for page_num in range(num_pages):
-                page = pdf_reader.pages[page_num]
-                
-                # Use layout mode for better text extraction
-                text = page.extract_text(extraction_mode="layout")
-                
+            # Stream each page to stdout as soon as it is extracted
+            for text in iter_page_texts(pdf_path, pdf_reader, extract_page_text, PARALLEL_PAGE_THRESHOLD):
                 if text:
-                    extracted_text += text + "\n\n"
+                    sys.stdout.write(text)
+                    sys.stdout.write("\n\n")
+                    has_text = has_text or bool(text.strip())
             
-            if not extracted_text.strip():
+            if not has_text:
                 print("Error: No text could be extracted from PDF", file=sys.stderr)
                 sys.exit(1)
             
-            # Output the extracted text
-            print(extracted_text, end='')
-            
     except FileNotFoundError:
         print(f"Error: File not found - {pdf_path}", file=sys.stderr)
         sys.exit(1)
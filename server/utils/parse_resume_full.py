@@ -9,10 +9,34 @@ Returns: JSON to stdout
 """
 
 import sys
+import os
 import json
 import re
+import hashlib
+import tempfile
 from pypdf import PdfReader
 import io
+from pdf_pages import iter_page_texts, map_file
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure stdout/stderr for UTF-8
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -40,77 +64,230 @@ SKILL_KEYWORDS = [
     'agile', 'scrum', 'jira', 'figma', 'photoshop'
 ]
 
+# The section splitter ends a section at the next unindented line, which relies
+# on pypdf's layout mode indenting body text. PDFium output is not indented, so
+# it is only used when RESUME_PDF_BACKEND=pdfium opts into faster extraction at
+# the cost of section accuracy.
+RESUME_PDF_BACKEND = os.environ.get('RESUME_PDF_BACKEND', 'pypdf')
+
+# pypdf documents with fewer pages are extracted in-process
+PARALLEL_PAGE_THRESHOLD = 4
+
+# Parsed results keyed by a hash of the PDF bytes, so re-uploads of the same
+# file skip extraction. Entries hold candidates' raw text and contact details,
+# so the cache is off unless RESUME_CACHE_DIR names a directory for it; only
+# the most recently written RESUME_CACHE_MAX_ENTRIES files are kept. Bump
+# RESUME_CACHE_VERSION whenever the parser's output changes.
+RESUME_CACHE_DIR = os.environ.get('RESUME_CACHE_DIR', '')
+RESUME_CACHE_MAX_ENTRIES = int(os.environ.get('RESUME_CACHE_MAX_ENTRIES', '1000'))
+RESUME_CACHE_VERSION = 4
+
+# Skills that are also letters or everyday words ("C. Smith", "R&D", "go live")
+# are matched case-sensitively against the original text with their own patterns
+_AMBIGUOUS_SKILLS = [
+    ('c', re.compile(r"(?<![\w.+#'&-])C(?![\w+#'&-]|\.[ \t]*[A-Z])")),
+    ('r', re.compile(r"(?<![\w.+#'&-])R(?![\w+#'&-]|\.[ \t]*[A-Z])")),
+    ('go', re.compile(r"(?<![\w.'-])(?:Go|GO|[Gg]olang)(?![\w'-])"))
+]
+_AMBIGUOUS_SKILL_NAMES = {skill for skill, _ in _AMBIGUOUS_SKILLS}
+_KEYWORD_SKILLS = [skill for skill in SKILL_KEYWORDS if skill not in _AMBIGUOUS_SKILL_NAMES]
+
+def _is_word_char(ch):
+    """Match the regex notion of a word character"""
+    return ch.isalnum() or ch == '_'
+
+# The remaining skills are matched by a single longest-match Aho-Corasick pass
+# when pyahocorasick is installed, otherwise by one alternation (longest skill
+# first) compiled with RE2 when available and the stdlib re otherwise. A skill
+# needs a word boundary only on edges that are word characters, so c++ is
+# found in "C++11" and c# before a comma.
+def _skill_pattern(skill, escape):
+    """Whole-word pattern source for one skill keyword"""
+    pattern = escape(skill)
+    if _is_word_char(skill[0]):
+        pattern = r'\b' + pattern
+    if _is_word_char(skill[-1]):
+        pattern += r'\b'
+    return pattern
+
+def _build_skill_regex():
+    """Compile every keyword skill into one alternation, with RE2 if installed"""
+    engine = re2 if re2 is not None else re
+    skills = sorted(_KEYWORD_SKILLS, key=len, reverse=True)
+    # Inline (?i) works in both engines, which take flags differently
+    return engine.compile('(?i)' + '|'.join(_skill_pattern(skill, engine.escape) for skill in skills))
+
+_SKILL_RE = _build_skill_regex()
+
+def _build_skill_automaton():
+    """Build the multi-pattern skill matcher, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for skill in _KEYWORD_SKILLS:
+        automaton.add_word(skill, (skill, _is_word_char(skill[0]), _is_word_char(skill[-1])))
+    automaton.make_automaton()
+    return automaton
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+# Section headings to look for, in order of preference
+EDUCATION_SECTIONS = ['EDUCATION', 'ACADEMIC', 'QUALIFICATION']
+EXPERIENCE_SECTIONS = ['EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT', 'PROFESSIONAL EXPERIENCE']
+PROJECT_SECTIONS = ['PROJECTS', 'PROJECT', 'PERSONAL PROJECTS', 'ACADEMIC PROJECTS']
+CERTIFICATION_SECTIONS = ['CERTIFICATION', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'COURSES']
+
+# Patterns compiled once at import instead of on every call
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}')
+# Any run of 10-12 digits also matches this, so it is the only phone pattern
+_PHONE_RE = re.compile(r'\+?\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}')
+_NAME_RE = re.compile(r'^[A-Za-z\s.\'-]+$')
+_GPA_RE = re.compile(r'GPA\s*[:\s]*(\d+\.?\d*)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'(\d{4})\s*[-–]\s*(\d{4}|Present)', re.IGNORECASE)
+
+# Plain-string fast paths checked before the patterns above. A phone number
+# needs at least 10 digits; for ASCII text, deleting everything else with
+# str.translate counts them far faster than a failed pattern scan.
+_NAME_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz .'-")
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+_MIN_PHONE_DIGITS = 10
+
+# Line classifiers for the section extractors. Keywords match anywhere in the
+# line, as substrings, so titles like INTERNSHIP still count as INTERN.
+_BULLET_RE = re.compile(r'[•\-–][•\-– ]*(.*)')
+_TITLE_RE = re.compile(r'INTERN|DEVELOPER|ENGINEER|ANALYST|MANAGER', re.IGNORECASE)
+_DEGREE_RE = re.compile(r'B\.TECH|B\.SC|B\.E|M\.TECH|M\.SC|MBA|PHD|BACHELOR|MASTER|\+2|12TH|10TH', re.IGNORECASE)
+
+# Every heading position in one scan of the text. The zero-width lookahead tries
+# each offset, so headings inside other headings (EXPERIENCE in WORK EXPERIENCE)
+# are still found; longest names come first and shorter prefixes are credited
+# from _SECTION_PREFIXES (PROJECT from PROJECTS).
+_SECTION_NAMES = EDUCATION_SECTIONS + EXPERIENCE_SECTIONS + PROJECT_SECTIONS + CERTIFICATION_SECTIONS
+_ALL_SECTIONS_RE = re.compile(
+    '(?=(' + '|'.join(sorted(_SECTION_NAMES, key=len, reverse=True)) + '))',
+    re.IGNORECASE
+)
+_SECTION_PREFIXES = {
+    name: [other for other in _SECTION_NAMES if name.startswith(other)]
+    for name in _SECTION_NAMES
+}
+_SECTION_BODY_RE = re.compile(r'\s*[:\n]?(.*?)(?=\n[A-Z]{2,}[:\s]|\Z)', re.DOTALL | re.IGNORECASE)
+
+def pdf_backend():
+    """Name of the text extractor in use: pdfium only when requested and installed"""
+    if RESUME_PDF_BACKEND == 'pdfium' and pdfium is not None:
+        return 'pdfium'
+    return 'pypdf'
+
 def extract_text_from_pdf(pdf_path):
+    """Extract text from PDF with the configured backend"""
+    if pdf_backend() == 'pdfium':
+        return extract_text_with_pdfium(pdf_path)
+    return extract_text_with_pypdf(pdf_path)
+
+def extract_text_with_pdfium(pdf_path):
+    """Extract text in content-stream order using PDFium"""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            texts.append(textpage.get_text_bounded())
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    # PDFium ends lines with CRLF; the section patterns expect bare newlines
+    return "\n".join(texts).replace("\r\n", "\n").replace("\r", "\n") + "\n"
+
+def extract_layout_text(page):
+    """Extract one page in layout mode, which keeps body lines indented"""
+    return page.extract_text(extraction_mode="layout")
+
+def extract_text_with_pypdf(pdf_path):
     """Extract text from PDF using pypdf"""
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text(extraction_mode="layout") + "\n"
-    return text
+    with map_file(pdf_path) as mapped:
+        pdf_reader = PdfReader(mapped)
+        page_texts = iter_page_texts(pdf_path, pdf_reader, extract_layout_text, PARALLEL_PAGE_THRESHOLD)
+        return "".join(page_text + "\n" for page_text in page_texts)
 
 def extract_email(text):
     """Extract email from text"""
-    pattern = r'[\w.+-]+@[\w.-]+\.[a-zA-Z]{2,}'
-    match = re.search(pattern, text)
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else None
 
 def extract_phone(text):
     """Extract phone number"""
-    patterns = [
-        r'\+?\d{1,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}',
-        r'\d{10,12}'
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0).strip()
-    return None
+    # ASCII text can only hold ASCII digits, so too few of them rules out a match
+    if text.isascii() and len(text.translate(_NON_DIGITS)) < _MIN_PHONE_DIGITS:
+        return None
+    match = _PHONE_RE.search(text)
+    return match.group(0).strip() if match else None
 
 def extract_name(text):
     """Extract name (usually first line)"""
-    lines = [l.strip() for l in text.split('\n') if l.strip()]
-    if lines:
-        first_line = lines[0]
-        # Check if it looks like a name
-        if len(first_line) < 50 and re.match(r'^[A-Za-z\s.\'-]+$', first_line):
+    # First line with any non-whitespace, without splitting the whole document
+    first_line = text.lstrip().split('\n', 1)[0].strip()
+    if first_line and len(first_line) < 50:
+        # Check if it looks like a name; the regex only matters for other whitespace
+        if all(c in _NAME_CHARS for c in first_line) or _NAME_RE.match(first_line):
             return first_line
     return None
 
-def extract_skills(text):
+def extract_skills(ctx):
     """Extract skills from resume text"""
-    text_lower = text.lower()
-    found_skills = []
+    text = ctx["text"]
+    found = {skill for skill, pattern in _AMBIGUOUS_SKILLS if pattern.search(text)}
     
-    for skill in SKILL_KEYWORDS:
-        # Use word boundary matching
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.append(skill)
+    if _SKILL_AUTOMATON is not None:
+        # The automaton is case-sensitive, so only this path needs a lower-case copy
+        text_lower = text.lower()
+        last = len(text_lower) - 1
+        # Longest match at each position, so c++ is not also read as c
+        for end, (skill, check_start, check_end) in _SKILL_AUTOMATON.iter_long(text_lower):
+            start = end - len(skill) + 1
+            # Only keep hits that are whole words
+            if check_start and start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if check_end and end < last and _is_word_char(text_lower[end + 1]):
+                continue
+            found.add(skill)
+    else:
+        found.update(match.group(0).lower() for match in _SKILL_RE.finditer(text))
     
-    return list(set(found_skills))
+    return [skill for skill in SKILL_KEYWORDS if skill in found]
 
-def extract_section(text, section_names):
-    """Extract content of a section"""
-    text_upper = text.upper()
-    content = ""
+def split_sections(text):
+    """Map each section heading to the content after its first occurrence"""
+    sections = {}
     
-    for section_name in section_names:
-        pattern = rf'{section_name}\s*[:\n]?(.*?)(?=\n[A-Z]{{2,}}[:\s]|\Z)'
-        match = re.search(pattern, text_upper, re.DOTALL)
-        if match:
-            # Get original case content
-            start = match.start(1)
-            end = match.end(1)
-            content = text[start:end].strip()
-            break
+    for match in _ALL_SECTIONS_RE.finditer(text):
+        for section_name in _SECTION_PREFIXES[match.group(1).upper()]:
+            if section_name not in sections:
+                body = _SECTION_BODY_RE.match(text, match.start() + len(section_name))
+                sections[section_name] = body.group(1).strip()
     
-    return content
+    return sections
+
+def extract_section(ctx, section_names):
+    """Extract content of the first section present"""
+    sections = ctx["sections"]
+    for section_name in section_names:
+        if section_name in sections:
+            return sections[section_name]
+    return ""
+
+def build_context(text):
+    """Compute the section map once for all extractors"""
+    return {
+        "text": text,
+        "sections": split_sections(text)
+    }
 
-def extract_education(text):
+def extract_education(ctx):
     """Extract education information"""
     education = []
-    section = extract_section(text, ['EDUCATION', 'ACADEMIC', 'QUALIFICATION'])
+    section = extract_section(ctx, EDUCATION_SECTIONS)
     
     if section:
         # Try to find degree patterns
@@ -119,16 +296,16 @@ def extract_education(text):
         
         for line in lines:
             # Look for degree keywords
-            if any(deg in line.upper() for deg in ['B.TECH', 'B.SC', 'B.E', 'M.TECH', 'M.SC', 'MBA', 'PHD', 'BACHELOR', 'MASTER', '+2', '12TH', '10TH']):
+            if _DEGREE_RE.search(line):
                 if current_edu:
                     education.append(current_edu)
                 current_edu = {"institution": "", "degree": line, "gpa": "", "duration": ""}
             # Look for GPA
-            gpa_match = re.search(r'GPA\s*[:\s]*(\d+\.?\d*)', line, re.IGNORECASE)
+            gpa_match = _GPA_RE.search(line)
             if gpa_match and current_edu:
                 current_edu["gpa"] = gpa_match.group(1)
             # Look for year
-            year_match = re.search(r'(\d{4})\s*[-–]\s*(\d{4}|Present)', line, re.IGNORECASE)
+            year_match = _YEAR_RE.search(line)
             if year_match and current_edu:
                 current_edu["duration"] = f"{year_match.group(1)} - {year_match.group(2)}"
         
@@ -137,10 +314,10 @@ def extract_education(text):
     
     return education if education else [{"institution": "", "degree": "", "gpa": "", "duration": ""}]
 
-def extract_experience(text):
+def extract_experience(ctx):
     """Extract work experience"""
     experience = []
-    section = extract_section(text, ['EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT', 'PROFESSIONAL EXPERIENCE'])
+    section = extract_section(ctx, EXPERIENCE_SECTIONS)
     
     if section:
         lines = [l.strip() for l in section.split('\n') if l.strip()]
@@ -148,7 +325,8 @@ def extract_experience(text):
         
         for line in lines:
             # Look for job titles or company names
-            if '|' in line or any(word in line.upper() for word in ['INTERN', 'DEVELOPER', 'ENGINEER', 'ANALYST', 'MANAGER']):
+            bullet = _BULLET_RE.match(line)
+            if '|' in line or _TITLE_RE.search(line):
                 if current_exp:
                     experience.append(current_exp)
                 parts = [p.strip() for p in line.split('|')]
@@ -158,19 +336,19 @@ def extract_experience(text):
                     "duration": parts[2] if len(parts) > 2 else "",
                     "responsibilities": []
                 }
-            elif line.startswith('–') or line.startswith('•') or line.startswith('-'):
+            elif bullet:
                 if current_exp:
-                    current_exp["responsibilities"].append(line.lstrip('–•- '))
+                    current_exp["responsibilities"].append(bullet.group(1))
         
         if current_exp:
             experience.append(current_exp)
     
     return experience
 
-def extract_projects(text):
+def extract_projects(ctx):
     """Extract projects"""
     projects = []
-    section = extract_section(text, ['PROJECTS', 'PROJECT', 'PERSONAL PROJECTS', 'ACADEMIC PROJECTS'])
+    section = extract_section(ctx, PROJECT_SECTIONS)
     
     if section:
         lines = [l.strip() for l in section.split('\n') if l.strip()]
@@ -178,7 +356,8 @@ def extract_projects(text):
         
         for line in lines:
             # Project title usually doesn't start with bullet
-            if not line.startswith('•') and not line.startswith('-') and not line.startswith('–'):
+            bullet = _BULLET_RE.match(line)
+            if not bullet:
                 if current_project:
                     projects.append(current_project)
                 current_project = {
@@ -186,9 +365,9 @@ def extract_projects(text):
                     "technologies": [],
                     "description": ""
                 }
-            elif line.startswith('•') or line.startswith('-') or line.startswith('–'):
+            else:
                 if current_project:
-                    desc = line.lstrip('•–- ')
+                    desc = bullet.group(1)
                     if current_project["description"]:
                         current_project["description"] += " " + desc
                     else:
@@ -199,39 +378,101 @@ def extract_projects(text):
     
     return projects
 
-def extract_certifications(text):
+def extract_certifications(ctx):
     """Extract certifications"""
     certs = []
-    section = extract_section(text, ['CERTIFICATION', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'COURSES'])
+    section = extract_section(ctx, CERTIFICATION_SECTIONS)
     
     if section:
         lines = [l.strip() for l in section.split('\n') if l.strip()]
         for line in lines:
-            if line.startswith('•') or line.startswith('-') or line.startswith('–'):
-                certs.append(line.lstrip('•–- ').replace('Completed ', '').strip())
+            bullet = _BULLET_RE.match(line)
+            if bullet:
+                certs.append(bullet.group(1).replace('Completed ', '').strip())
             elif len(line) > 10:
                 certs.append(line)
     
     return certs
 
+def file_digest(pdf_path):
+    """SHA-256 of the file contents, hashed straight from the mapping"""
+    with map_file(pdf_path) as mapped:
+        return hashlib.sha256(mapped).hexdigest()
+
+def cache_path_for(digest):
+    """Location of the cached parse for a file digest"""
+    # Backends extract different text, so their results are cached separately
+    return os.path.join(RESUME_CACHE_DIR, f"{digest}.{pdf_backend()}.v{RESUME_CACHE_VERSION}.json")
+
+def read_cached_resume(cache_path):
+    """Return a cached parse, or None if missing or unreadable"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_cached_resume(cache_path, resume_data):
+    """Atomically store a parse result; failures only cost the cache"""
+    tmp_path = None
+    try:
+        os.makedirs(RESUME_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=RESUME_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(resume_data, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+        evict_cached_resumes()
+    except (OSError, ValueError) as e:
+        # pypdf can leave lone surrogates in the text, which utf-8 cannot encode
+        print(f"Could not write resume cache {cache_path}: {e}", file=sys.stderr)
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def evict_cached_resumes():
+    """Delete the oldest cache entries beyond RESUME_CACHE_MAX_ENTRIES"""
+    entries = [entry for entry in os.scandir(RESUME_CACHE_DIR) if entry.name.endswith('.json')]
+    if len(entries) <= RESUME_CACHE_MAX_ENTRIES:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[RESUME_CACHE_MAX_ENTRIES:]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
 def parse_resume(pdf_path):
     """Main function to parse resume and return structured JSON"""
     try:
+        cache_path = cache_path_for(file_digest(pdf_path)) if RESUME_CACHE_DIR else None
+        if cache_path:
+            cached = read_cached_resume(cache_path)
+            if cached is not None:
+                return cached
+        
         text = extract_text_from_pdf(pdf_path)
+        ctx = build_context(text)
         
         resume_data = {
             "name": extract_name(text),
             "email": extract_email(text),
             "phone": extract_phone(text),
-            "education": extract_education(text),
-            "technicalSkills": extract_skills(text),
-            "experience": extract_experience(text),
-            "projects": extract_projects(text),
-            "certifications": extract_certifications(text),
+            "education": extract_education(ctx),
+            "technicalSkills": extract_skills(ctx),
+            "experience": extract_experience(ctx),
+            "projects": extract_projects(ctx),
+            "certifications": extract_certifications(ctx),
             "rawText": text,
             "parsed": True
         }
         
+        if cache_path:
+            write_cached_resume(cache_path, resume_data)
+        
         return resume_data
         
     except Exception as e:
@@ -249,4 +490,16 @@ if __name__ == "__main__":
     
     pdf_file_path = sys.argv[1]
     result = parse_resume(pdf_file_path)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    # The server parses stdout as a whole, so the JSON is written compactly
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(result)
+        except orjson.JSONEncodeError:
+            # pypdf can leave lone surrogates in rawText, which orjson rejects
+            payload = None
+    if payload is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload + b"\n")
+    else:
+        print(json.dumps(result, ensure_ascii=False, separators=(',', ':')))
@@ -0,0 +1,42 @@
+"""
+Per-page PDF text extraction shared by extract_pdf.py and parse_resume_full.py
+Longer documents are split across worker processes, one page per job
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from pypdf import PdfReader
+
+@contextmanager
+def map_file(pdf_path):
+    """Memory-map a file read-only, so readers page it in instead of buffering a copy"""
+    with open(pdf_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+def _extract_page_worker(job):
+    """Process-pool entry point: readers are not picklable, so each worker opens its own"""
+    pdf_path, page_num, extract_page = job
+    with map_file(pdf_path) as mapped:
+        return extract_page(PdfReader(mapped).pages[page_num])
+
+def iter_page_texts(pdf_path, pdf_reader, extract_page, parallel_threshold):
+    """Yield extract_page(page) for every page in order
+
+    PDFs with at least parallel_threshold pages are fanned out to worker
+    processes when more than one CPU is available; below that, worker
+    start-up would cost more than it saves. extract_page must be a
+    module-level function so it can be sent to the workers.
+    """
+    num_pages = len(pdf_reader.pages)
+    workers = min(num_pages, os.cpu_count() or 1)
+
+    if num_pages < parallel_threshold or workers < 2:
+        for page in pdf_reader.pages:
+            yield extract_page(page)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_extract_page_worker, [(pdf_path, i, extract_page) for i in range(num_pages)])